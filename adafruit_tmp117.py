@@ -32,19 +32,13 @@ Implementation Notes
 * Adafruit's Bus Device library:
   https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
 
-* Adafruit's Register library:
-  https://github.com/adafruit/Adafruit_CircuitPython_Register
-
 """
 
 import time
-from collections import namedtuple
+import struct
+import array
 from micropython import const
 from adafruit_bus_device import i2c_device
-from adafruit_register.i2c_struct import ROUnaryStruct, UnaryStruct
-
-from adafruit_register.i2c_bit import RWBit, ROBit
-from adafruit_register.i2c_bits import RWBits, ROBits
 
 try:
     from typing import Sequence, Tuple, Optional, Union
@@ -56,7 +50,7 @@ __version__ = "0.0.0+auto.0"
 __repo__ = "https:#github.com/adafruit/Adafruit_CircuitPython_TMP117.git"
 
 
-_I2C_ADDR = 0x48  # default I2C Address
+_I2C_ADDR = const(0x48)  # default I2C Address
 _TEMP_RESULT = const(0x00)
 _CONFIGURATION = const(0x01)
 _T_HIGH_LIMIT = const(0x02)
@@ -67,16 +61,70 @@ _EEPROM2 = const(0x06)
 _TEMP_OFFSET = const(0x07)
 _EEPROM3 = const(0x08)
 _DEVICE_ID = const(0x0F)
-_DEVICE_ID_VALUE = 0x0117
+_DEVICE_ID_VALUE = const(0x0117)
+# const() only accepts integers, so the resolution stays a plain global
 _TMP117_RESOLUTION = (
     0.0078125  # Resolution of the device, found on (page 1 of datasheet)
 )
+_TMP117_RESOLUTION_INV = const(128)  # 1 / _TMP117_RESOLUTION, for fixed point scaling
+_RAW_MAX = const(32767)  # range of the signed 16-bit temperature registers
+_RAW_MIN = const(-32768)
+
+_CONTINUOUS_CONVERSION_MODE = const(0b00)  # Continuous Conversion Mode
+_ONE_SHOT_MODE = const(0b11)  # One Shot Conversion Mode
+_SHUTDOWN_MODE = const(0b01)  # Shutdown Conversion Mode
+
+# CONFIGURATION register fields
+_CONFIG_WRITABLE = const(0x0FFC)  # status bits 15:12 are read-only, 1:0 self-clearing
+_CONFIG_SOFT_RESET = const(0x0002)
+_MODE_SHIFT = const(10)
+_MODE_MASK = const(0b11)
+_CONV_SHIFT = const(7)
+_CONV_MASK = const(0b111)
+_AVG_SHIFT = const(5)
+_AVG_MASK = const(0b11)
+_ALERT_MODE_SHIFT = const(4)  # T/nA bit in the datasheet
+_ALERT_MODE_MASK = const(0b1)
+# Seconds per averaged conversion, indexed by the AVG field, and minimum conversion cycle time,
+# indexed by the CONV field; used to bound how long `temperatures` waits for each measurement
+_AVERAGED_CONVERSION_TIME = (0.0155, 0.125, 0.5, 1.0)
+_CONVERSION_CYCLE_TIME = (0.0155, 0.125, 0.25, 0.5, 1.0, 4.0, 8.0, 16.0)
+# Continuous conversion, 1s between conversions, 8x averaging, window alert mode,
+# active low alert pin reporting alerts; the datasheet's power-on default
+_DEFAULT_CONFIG = const(0x0220)
+
+
+class AlertStatus:
+    """The triggered status of the high and low temperature alerts, as returned by
+    `TMP117.alert_status`"""
+
+    __slots__ = ("high_alert", "low_alert")
+
+    def __init__(self, high_alert: bool, low_alert: bool):
+        self.high_alert = high_alert
+        self.low_alert = low_alert
+
+    def __iter__(self):
+        # allows `high_alert, low_alert = tmp117.alert_status`
+        return iter((self.high_alert, self.low_alert))
+
+    def __getitem__(self, index: int) -> bool:
+        return (self.high_alert, self.low_alert)[index]
+
+    def __len__(self):
+        return 2
+
+    def __repr__(self):
+        return "AlertStatus(high_alert=%r, low_alert=%r)" % (
+            self.high_alert,
+            self.low_alert,
+        )
 
-_CONTINUOUS_CONVERSION_MODE = 0b00  # Continuous Conversion Mode
-_ONE_SHOT_MODE = 0b11  # One Shot Conversion Mode
-_SHUTDOWN_MODE = 0b01  # Shutdown Conversion Mode
-
-AlertStatus = namedtuple("AlertStatus", ["high_alert", "low_alert"])
+    def __eq__(self, other):
+        # compares equal to another `AlertStatus` or a plain tuple, as the namedtuple did
+        if isinstance(other, AlertStatus):
+            other = (other.high_alert, other.low_alert)
+        return (self.high_alert, self.low_alert) == other
 
 
 def _convert_to_integer(bytes_to_convert: bytearray) -> int:
@@ -92,26 +140,41 @@ def _convert_to_integer(bytes_to_convert: bytearray) -> int:
 
 
 class CV:
-    """struct helper"""
+    """struct helper
+
+    ``string`` and ``lsb`` are tuples indexed by member value (previously dicts keyed by it).
+    Values that are not members hold `None`, e.g. ``MeasurementMode.string[2]``, and negative
+    indices wrap around rather than raising, so check `is_valid` before looking up an
+    untrusted value."""
 
     @classmethod
     def add_values(
         cls, value_tuples: Sequence[Tuple[str, int, Union[int, str], Optional[int]]]
     ):
         """Add CV values to the class"""
-        cls.string = {}
-        cls.lsb = {}
+        # values are small dense integers, so index by value rather than hashing
+        size = max(value_tuple[1] for value_tuple in value_tuples) + 1
+        string = [None] * size
+        lsb = [None] * size
+        # bit n is set if n is a member, so validation is a shift and a mask
+        cls._valid_mask = 0
 
         for value_tuple in value_tuples:
-            name, value, string, lsb = value_tuple
+            name, value, value_string, value_lsb = value_tuple
             setattr(cls, name, value)
-            cls.string[value] = string
-            cls.lsb[value] = lsb
+            string[value] = value_string
+            lsb[value] = value_lsb
+            cls._valid_mask |= 1 << value
+
+        cls.string = tuple(string)
+        cls.lsb = tuple(lsb)
 
     @classmethod
     def is_valid(cls, value: int) -> bool:
         """Validate that a given value is a member"""
-        return value in cls.string
+        if not isinstance(value, int) or value < 0:
+            return False
+        return bool((cls._valid_mask >> value) & 1)
 
 
 class AverageCount(CV):
@@ -168,31 +231,54 @@ MeasurementMode.add_values(
 )
 
 
-class TMP117:
-    """Library for the TI TMP117 high-accuracy temperature sensor"""
+class _ConfigBatch:
+    """Context manager returned by `TMP117.config_batch`"""
 
-    _part_id = ROUnaryStruct(_DEVICE_ID, ">H")
-    _raw_temperature = ROUnaryStruct(_TEMP_RESULT, ">h")
-    _raw_high_limit = UnaryStruct(_T_HIGH_LIMIT, ">h")
-    _raw_low_limit = UnaryStruct(_T_LOW_LIMIT, ">h")
-    _raw_temperature_offset = UnaryStruct(_TEMP_OFFSET, ">h")
+    def __init__(self, sensor: "TMP117"):
+        self._sensor = sensor
+        self._saved_config = None
 
-    # these three bits will clear on read in some configurations, so we read them together
-    _alert_status_data_ready = ROBits(3, _CONFIGURATION, 13, 2, False)
-    _eeprom_busy = ROBit(_CONFIGURATION, 12, 2, False)
-    _mode = RWBits(2, _CONFIGURATION, 10, 2, False)
+    def __enter__(self):
+        # pylint: disable=protected-access
+        self._saved_config = self._sensor._config_shadow
+        self._sensor._config_batch_depth += 1
+        return self._sensor
 
-    _raw_measurement_delay = RWBits(3, _CONFIGURATION, 7, 2, False)
-    _raw_averaged_measurements = RWBits(2, _CONFIGURATION, 5, 2, False)
+    def __exit__(self, exception_type, exception_value, traceback):
+        # pylint: disable=protected-access
+        self._sensor._config_batch_depth -= 1
+        if exception_type is not None:
+            # discard the block's changes rather than apply half of them
+            self._sensor._config_shadow = self._saved_config
+        elif not self._sensor._config_batch_depth:
+            self._sensor._write_config()
 
-    _raw_alert_mode = RWBit(_CONFIGURATION, 4, 2, False)  # T/nA bits in the datasheet
-    _int_active_high = RWBit(_CONFIGURATION, 3, 2, False)
-    _data_ready_int_en = RWBit(_CONFIGURATION, 2, 2, False)
-    _soft_reset = RWBit(_CONFIGURATION, 1, 2, False)
+
+class TMP117:  # pylint: disable=too-many-instance-attributes
+    """Library for the TI TMP117 high-accuracy temperature sensor"""
+
+    # constant register pointers for the polling paths, so they don't touch `_addr_buf`
+    _TEMP_RESULT_ADDR = bytes((_TEMP_RESULT,))
+    _CONFIGURATION_ADDR = bytes((_CONFIGURATION,))
 
     def __init__(self, i2c_bus: I2C, address: int = _I2C_ADDR):
         self.i2c_device = i2c_device.I2CDevice(i2c_bus, address)
-        if self._part_id != _DEVICE_ID_VALUE:
+        self._addr_buf = bytearray(1)
+        self._data_buf = bytearray(2)
+        # one write buffer per writable register, with the pointer byte already in place
+        self._config_buf = bytearray((_CONFIGURATION, 0, 0))
+        self._high_limit_buf = bytearray((_T_HIGH_LIMIT, 0, 0))
+        self._low_limit_buf = bytearray((_T_LOW_LIMIT, 0, 0))
+        self._offset_buf = bytearray((_TEMP_OFFSET, 0, 0))
+        # shadow of the writable CONFIGURATION bits, populated by `reset`
+        self._config_shadow = 0
+        self._config_batch_depth = 0
+        # last raw values written to the limit and offset registers, `None` if unknown
+        self._shadow_high = None
+        self._shadow_low = None
+        self._shadow_offset = None
+        self._read_register(_DEVICE_ID, self._data_buf)
+        if (self._data_buf[0] << 8 | self._data_buf[1]) != _DEVICE_ID_VALUE:
             raise AttributeError("Cannot find a TMP117")
         # currently set when `alert_status` is read, but not exposed
         self.reset()
@@ -200,17 +286,25 @@ class TMP117:
 
     def reset(self):
         """Reset the sensor to its unconfigured power-on state"""
-        self._soft_reset = True
+        self._write16(self._config_buf, _CONFIG_SOFT_RESET)
+        # Datasheet specifies that reset will finish in 2ms
+        time.sleep(0.002)
+        self._config_shadow = self._read16(_CONFIGURATION) & _CONFIG_WRITABLE
+        # the limits and offset are reloaded from EEPROM by the reset
+        self._shadow_high = None
+        self._shadow_low = None
+        self._shadow_offset = None
 
     def initialize(self):
         """Configure the sensor with sensible defaults. `initialize` is primarily provided to be
         called after `reset`, however it can also be used to easily set the sensor to a known
         configuration"""
-        # Datasheet specifies that reset will finish in 2ms however by default the first
-        # conversion will be averaged 8x and take 1s
-        # TODO: sleep depending on current averaging config
-        self._set_mode_and_wait_for_measurement(_CONTINUOUS_CONVERSION_MODE)  # one shot
-        time.sleep(1)
+        # the whole default configuration goes out in the single write made when setting
+        # the mode, rather than one read-modify-write per setting
+        self._config_shadow = _DEFAULT_CONFIG
+        # `reset` already waits the 2ms the datasheet specifies, and polling for data ready
+        # returns as soon as the first (averaged) conversion is done, so no fixed sleep
+        self._set_mode_and_wait_for_measurement(_CONTINUOUS_CONVERSION_MODE)
 
     @property
     def temperature(self):
@@ -218,6 +312,15 @@ class TMP117:
 
         return self._read_temperature()
 
+    @property
+    def temperature_raw(self) -> int:
+        """The current measured temperature as the signed integer read from the sensor, in units
+        of 1/128 degrees Celsius (two's complement, 7 fractional bits). Useful in tight loops that
+        only compare or store readings, as it avoids float math; divide by 128 (or shift right by
+        7 for whole degrees) to convert to degrees Celsius."""
+
+        return self._read_raw_temperature()
+
     @property
     def temperature_offset(self):
         """User defined temperature offset to be added to measurements from `temperature`
@@ -239,14 +342,19 @@ class TMP117:
                 time.sleep(1)
 
         """
-        return self._raw_temperature_offset * _TMP117_RESOLUTION
+        return self._read16(_TEMP_OFFSET) * _TMP117_RESOLUTION
 
     @temperature_offset.setter
     def temperature_offset(self, value: float):
-        if value > 256 or value < -256:
-            raise AttributeError("temperature_offset must be from -256 to 256")
-        scaled_offset = int(value / _TMP117_RESOLUTION)
-        self._raw_temperature_offset = scaled_offset
+        scaled_offset = value * _TMP117_RESOLUTION_INV
+        # compared before truncating to int so both bounds are exact; also rejects inf and nan
+        if not _RAW_MIN <= scaled_offset <= _RAW_MAX:
+            raise AttributeError("temperature_offset must be from -256 to 255.9921875")
+        scaled_offset = int(scaled_offset)
+        if scaled_offset == self._shadow_offset:
+            return
+        self._write16(self._offset_buf, scaled_offset)
+        self._shadow_offset = scaled_offset
 
     @property
     def high_limit(self):
@@ -254,14 +362,18 @@ class TMP117:
         value, the `high_alert` attribute of the `alert_status` property will be True. See the
         documentation for `alert_status` for more information"""
 
-        return self._raw_high_limit * _TMP117_RESOLUTION
+        return self._read16(_T_HIGH_LIMIT) * _TMP117_RESOLUTION
 
     @high_limit.setter
     def high_limit(self, value: float):
-        if value > 256 or value < -256:
-            raise AttributeError("high_limit must be from 255 to -256")
-        scaled_limit = int(value / _TMP117_RESOLUTION)
-        self._raw_high_limit = scaled_limit
+        scaled_limit = value * _TMP117_RESOLUTION_INV
+        if not _RAW_MIN <= scaled_limit <= _RAW_MAX:
+            raise AttributeError("high_limit must be from -256 to 255.9921875")
+        scaled_limit = int(scaled_limit)
+        if scaled_limit == self._shadow_high:
+            return
+        self._write16(self._high_limit_buf, scaled_limit)
+        self._shadow_high = scaled_limit
 
     @property
     def low_limit(self):
@@ -269,19 +381,28 @@ class TMP117:
         this value, the `low_alert` attribute of the `alert_status` property will be True. See the
         documentation for `alert_status` for more information"""
 
-        return self._raw_low_limit * _TMP117_RESOLUTION
+        return self._read16(_T_LOW_LIMIT) * _TMP117_RESOLUTION
 
     @low_limit.setter
     def low_limit(self, value: float):
-        if value > 256 or value < -256:
-            raise AttributeError("low_limit must be from 255 to -256")
-        scaled_limit = int(value / _TMP117_RESOLUTION)
-        self._raw_low_limit = scaled_limit
+        scaled_limit = value * _TMP117_RESOLUTION_INV
+        if not _RAW_MIN <= scaled_limit <= _RAW_MAX:
+            raise AttributeError("low_limit must be from -256 to 255.9921875")
+        scaled_limit = int(scaled_limit)
+        if scaled_limit == self._shadow_low:
+            return
+        self._write16(self._low_limit_buf, scaled_limit)
+        self._shadow_low = scaled_limit
 
     @property
     def alert_status(self):
-        """The current triggered status of the high and low temperature alerts as a AlertStatus
-        named tuple with attributes for the triggered status of each alert.
+        """The current triggered status of the high and low temperature alerts as an `AlertStatus`
+        with attributes for the triggered status of each alert.
+
+        `AlertStatus` used to be a named tuple. It still unpacks, indexes (``[0]`` is
+        ``high_alert``), has a length of 2 and compares equal to a tuple of the same values, but
+        it is not a ``tuple`` subclass and is not hashable, so it can't be used in a ``set`` or as a
+        ``dict`` key.
 
         .. code-block :: python
 
@@ -313,8 +434,8 @@ class TMP117:
                 time.sleep(1)
 
         """
-        high_alert, low_alert, *_ = self._read_status()
-        return AlertStatus(high_alert=high_alert, low_alert=low_alert)
+        high_alert, low_alert, _ = self._read_status()
+        return AlertStatus(high_alert=bool(high_alert), low_alert=bool(low_alert))
 
     @property
     def averaged_measurements(self):
@@ -353,13 +474,13 @@ class TMP117:
                 time.sleep(0.1)
 
         """
-        return self._raw_averaged_measurements
+        return self._get_config_bits(_AVG_MASK, _AVG_SHIFT)
 
     @averaged_measurements.setter
     def averaged_measurements(self, value: int):
         if not AverageCount.is_valid(value):
             raise AttributeError("averaged_measurements must be an `AverageCount`")
-        self._raw_averaged_measurements = value
+        self._set_config_bits(_AVG_MASK, _AVG_SHIFT, value)
 
     @property
     def measurement_mode(self):
@@ -402,7 +523,7 @@ class TMP117:
 
         """
         # pylint: enable=line-too-long
-        return self._mode
+        return self._get_config_bits(_MODE_MASK, _MODE_SHIFT)
 
     @measurement_mode.setter
     def measurement_mode(self, value: int):
@@ -450,13 +571,83 @@ class TMP117:
 
         """
 
-        return self._raw_measurement_delay
+        return self._get_config_bits(_CONV_MASK, _CONV_SHIFT)
 
     @measurement_delay.setter
     def measurement_delay(self, value: int):
         if not MeasurementDelay.is_valid(value):
             raise AttributeError("measurement_delay must be a `MeasurementDelay`")
-        self._raw_measurement_delay = value
+        self._set_config_bits(_CONV_MASK, _CONV_SHIFT, value)
+
+    def temperatures(
+        self, count: int, out: Optional[array.array] = None
+    ) -> array.array:
+        """Read `count` new measurements in degrees Celsius, waiting for each conversion to
+        complete. The I2C bus is held for the whole batch rather than claimed and released for
+        every read, which makes this suited to logging at the sensor's full rate.
+
+        The results are stored in ``out`` if given, which must be a float `array.array` with
+        room for at least ``count`` values (a `ValueError` is raised otherwise), so that repeated
+        calls don't allocate. Otherwise a new array is returned.
+
+        **Note:** `measurement_mode` must be :py:const:`MeasurementMode.CONTINUOUS` (otherwise
+        no new measurements arrive and a `RuntimeError` is raised), and the batch takes at least
+        ``count`` times the conversion period set by `averaged_measurements` and
+        `measurement_delay`, during which no other device can use the bus. If a measurement
+        doesn't arrive within twice that period, for example because the sensor was reset or
+        shut down elsewhere, a `RuntimeError` is raised.
+
+        .. code-block::python
+
+            import array
+            import board
+            from adafruit_tmp117 import TMP117, AverageCount, MeasurementDelay
+
+            i2c = board.I2C()  # uses board.SCL and board.SDA
+
+            tmp117 = TMP117(i2c)
+            tmp117.averaged_measurements = AverageCount.AVERAGE_1X
+            tmp117.measurement_delay = MeasurementDelay.DELAY_0_0015_S
+
+            samples = array.array("f", [0.0] * 64)
+            while True:
+                tmp117.temperatures(64, samples)
+                print("Average temperature:", sum(samples) / len(samples))
+
+        """
+        if (
+            self._get_config_bits(_MODE_MASK, _MODE_SHIFT)
+            != _CONTINUOUS_CONVERSION_MODE
+        ):
+            raise RuntimeError("temperatures requires `MeasurementMode.CONTINUOUS`")
+        if out is None:
+            out = array.array("f", [0.0] * count)
+        elif len(out) < count:
+            raise ValueError("out must have room for `count` values")
+        cycle_time = max(
+            _AVERAGED_CONVERSION_TIME[self._get_config_bits(_AVG_MASK, _AVG_SHIFT)],
+            _CONVERSION_CYCLE_TIME[self._get_config_bits(_CONV_MASK, _CONV_SHIFT)],
+        )
+        timeout = 2 * cycle_time + 0.1
+        buf = self._data_buf
+        with self.i2c_device as i2c:
+            # reading CONFIGURATION clears a data ready flag left from before this call, so
+            # the first sample is a new measurement too
+            i2c.write_then_readinto(self._CONFIGURATION_ADDR, buf)
+            for index in range(count):
+                deadline = time.monotonic() + timeout
+                # poll the data ready flag, bit 13 of CONFIGURATION
+                i2c.write_then_readinto(self._CONFIGURATION_ADDR, buf)
+                while not buf[0] & 0x20:
+                    if time.monotonic() > deadline:
+                        raise RuntimeError("Timed out waiting for a new measurement")
+                    time.sleep(0.001)
+                    i2c.write_then_readinto(self._CONFIGURATION_ADDR, buf)
+                i2c.write_then_readinto(self._TEMP_RESULT_ADDR, buf)
+                raw = (buf[0] << 8) | buf[1]
+                raw = raw - 0x10000 if raw & 0x8000 else raw
+                out[index] = raw * _TMP117_RESOLUTION
+        return out
 
     def take_single_measurement(self) -> float:
         """Perform a single measurement cycle respecting the value of `averaged_measurements`,
@@ -484,13 +675,36 @@ class TMP117:
 
         The default is :py:const:`AlertMode.WINDOW`"""
 
-        return self._raw_alert_mode
+        return self._get_config_bits(_ALERT_MODE_MASK, _ALERT_MODE_SHIFT)
 
     @alert_mode.setter
     def alert_mode(self, value: int):
         if not AlertMode.is_valid(value):
             raise AttributeError("alert_mode must be an `AlertMode`")
-        self._raw_alert_mode = value
+        self._set_config_bits(_ALERT_MODE_MASK, _ALERT_MODE_SHIFT, value)
+
+    def config_batch(self) -> _ConfigBatch:
+        """Returns a context manager that defers writing `averaged_measurements`,
+        `measurement_delay` and `alert_mode` changes to the sensor until the block exits, so
+        that several settings are applied with a single write of the configuration register.
+        Changing `measurement_mode` inside the block writes immediately. If the block raises an
+        exception, the settings changed in it are discarded and nothing is written.
+
+        .. code-block::python
+
+            import board
+            from adafruit_tmp117 import TMP117, AverageCount, MeasurementDelay
+
+            i2c = board.I2C()  # uses board.SCL and board.SDA
+
+            tmp117 = TMP117(i2c)
+
+            with tmp117.config_batch():
+                tmp117.averaged_measurements = AverageCount.AVERAGE_32X
+                tmp117.measurement_delay = MeasurementDelay.DELAY_1_S
+
+        """
+        return _ConfigBatch(self)
 
     @property
     def serial_number(self):
@@ -518,25 +732,76 @@ class TMP117:
         return _convert_to_integer(combined_id)
 
     def _set_mode_and_wait_for_measurement(self, mode: int) -> float:
-        self._mode = mode
+        # always written immediately, even inside `config_batch`, as we wait on the result
+        self._config_shadow &= ~(_MODE_MASK << _MODE_SHIFT)
+        self._config_shadow |= mode << _MODE_SHIFT
+        # reading CONFIGURATION clears a data ready flag left over from an earlier
+        # conversion, so the poll below only sees a conversion finishing after this point.
+        # It must come before the write: reading after it could consume the flag of a
+        # fast one-shot conversion and leave the poll waiting on a shut down sensor
+        self._read_status()
+        self._write_config()
         # poll for data ready
         while not self._read_status()[2]:
             time.sleep(0.001)
+        if mode == _ONE_SHOT_MODE:
+            # the sensor switches itself to shutdown once the one-shot conversion is done
+            self._config_shadow &= ~(_MODE_MASK << _MODE_SHIFT)
+            self._config_shadow |= _SHUTDOWN_MODE << _MODE_SHIFT
 
         return self._read_temperature()
 
+    def _get_config_bits(self, mask: int, shift: int) -> int:
+        return (self._config_shadow >> shift) & mask
+
+    def _set_config_bits(self, mask: int, shift: int, value: int) -> None:
+        self._config_shadow &= ~(mask << shift)
+        self._config_shadow |= (value & mask) << shift
+        if not self._config_batch_depth:
+            self._write_config()
+
+    def _write_config(self) -> None:
+        self._write16(self._config_buf, self._config_shadow)
+
     # eeprom write enable to set defaults for limits and config
     # requires context manager or something to perform a general call reset
 
+    def _read_register(self, register: int, buf: bytearray) -> None:
+        # The TMP117 does not auto-increment the register pointer, so each register
+        # needs its own pointer write; doing it as one write-then-read keeps it to a
+        # single bus transaction and `buf` is reused rather than allocated per read
+        self._addr_buf[0] = register
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._addr_buf, buf)
+
+    def _read16(self, register: int) -> int:
+        self._read_register(register, self._data_buf)
+        return struct.unpack_from(">h", self._data_buf)[0]
+
+    def _write16(self, buf: bytearray, value: int) -> None:
+        # `buf` is one of the per-register write buffers; only the value bytes change
+        struct.pack_into(">h", buf, 1, value)
+        with self.i2c_device as i2c:
+            i2c.write(buf)
+
     def _read_status(self) -> Tuple[int, int, int]:
         # 3 bits: high_alert, low_alert, data_ready
-        status_flags = self._alert_status_data_ready
+        # these three bits will clear on read in some configurations, so we read them together
+        self._read_register(_CONFIGURATION, self._data_buf)
+        status_flags = self._data_buf[0] >> 5
 
-        high_alert = 0b100 & status_flags > 0
-        low_alert = 0b010 & status_flags > 0
-        data_ready = 0b001 & status_flags > 0
+        high_alert = (status_flags >> 2) & 1
+        low_alert = (status_flags >> 1) & 1
+        data_ready = status_flags & 1
 
         return (high_alert, low_alert, data_ready)
 
+    def _read_raw_temperature(self) -> int:
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._TEMP_RESULT_ADDR, self._data_buf)
+        # sign-extend the big-endian 16-bit value without going through `struct`
+        raw = (self._data_buf[0] << 8) | self._data_buf[1]
+        return raw - 0x10000 if raw & 0x8000 else raw
+
     def _read_temperature(self) -> float:
-        return self._raw_temperature * _TMP117_RESOLUTION
+        return self._read_raw_temperature() * _TMP117_RESOLUTION